@@ -11,9 +11,11 @@ Implementation notes
   has already been moved/renamed to its final destination.
 * Performs the actual network request in a worker thread so that
   Picard's UI thread is not blocked while contacting LRCLIB.
-* Uses Python's urllib with SSL verification disabled for LRCLIB,
-  because the embedded Python on some macOS deployments can lack a
-  proper certificate store.
+* Uses Python's http.client with a small keep-alive connection pool so
+  an album save reuses one TLS connection instead of paying a full
+  TCP + TLS handshake per track.  SSL verification is disabled for
+  LRCLIB, because the embedded Python on some macOS deployments can
+  lack a proper certificate store.
 * Does NOT modify any tags inside the audio file – it only writes
   external sidecar lyrics files.
 """
@@ -31,179 +33,745 @@ PLUGIN_API_VERSIONS = ["2.0", "2.1", "2.2", "2.3", "2.4", "2.5", "2.6"]
 PLUGIN_LICENSE = "MIT"
 PLUGIN_LICENSE_URL = "https://opensource.org/licenses/MIT"
 
+import atexit
+import concurrent.futures
+import hashlib
+import http.client
 import json
+import logging
 import os
+import queue
+import re
+import sqlite3
 import ssl
+import sys
 import threading
+import time
+import unicodedata
+import zlib
 from urllib.parse import urlencode
-from urllib.request import Request, urlopen
 
 from picard import log
 from picard.file import register_file_post_save_processor
 
 
+def _info_logging_enabled():
+    """
+    Best-effort check whether Picard will emit info-level log lines.
+
+    When the log level is WARNING (the default for many setups), the
+    per-file log.info calls below still pay for %-formatting and repr()
+    of their arguments; _VERBOSE lets the hot path skip them entirely.
+    """
+    logger = getattr(log, "main_logger", None)
+    try:
+        return logger.isEnabledFor(logging.INFO)
+    except Exception:
+        return True
+
+
+_VERBOSE = _info_logging_enabled()
+
+
 # minor clean-up (reviewer comment)
-LRCLIB_URL = "https://lrclib.net/api/get?"
+LRCLIB_HOST = "lrclib.net"
+LRCLIB_GET_PATH = "/api/get?"
+LRCLIB_SEARCH_PATH = "/api/search?"
+HTTP_TIMEOUT = 15
+
+# Files saved within this window that share artist+album are looked up
+# with one /api/search call instead of one /api/get per track.
+ALBUM_BATCH_WINDOW = 0.5
+
+# Tracks are matched against album search results by title plus
+# duration within this many seconds.
+DURATION_TOLERANCE = 2
+
+# Responses are consumed in chunks of this size so receive overlaps
+# with buffering, and an oversized (misbehaving) body is abandoned as
+# soon as it crosses the cap instead of being read to the end first.
+READ_CHUNK_BYTES = 8192
+MAX_RESPONSE_BYTES = 1024 * 1024
+
+# When False (the default), a file that already has a non-empty .lrc or
+# .txt sidecar next to it is skipped entirely -- no LRCLIB request is
+# made for it.  Set to True to always refresh sidecars.
+OVERWRITE_EXISTING = False
+
+# Maximum number of concurrent LRCLIB lookups.  Workers are reused across
+# saves so a large batch does not pay thread creation/teardown per file.
+# Each worker can block on a socket for up to HTTP_TIMEOUT seconds, so
+# users saving very large batches can raise the cap via the
+# LRCLIB_MAX_WORKERS environment variable (clamped to 1..64).
+try:
+    MAX_WORKERS = max(1, min(int(os.environ["LRCLIB_MAX_WORKERS"]), 64))
+except (KeyError, ValueError):
+    MAX_WORKERS = 8
+
+# Cap on tasks waiting for a worker.  When Picard floods the plugin
+# with saves faster than LRCLIB allows, submission blocks briefly
+# instead of growing an unbounded queue of snapshot dicts and paths.
+MAX_QUEUED = 256
+
+
+class _BoundedExecutor(concurrent.futures.ThreadPoolExecutor):
+    """ThreadPoolExecutor with a bounded (rather than infinite) queue."""
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._work_queue = queue.Queue(maxsize=MAX_QUEUED)
+
+
+_EXECUTOR = _BoundedExecutor(
+    max_workers=MAX_WORKERS,
+    thread_name_prefix="lrclib",
+)
+
+# Paths currently queued or in flight, so a re-fired post_save for the
+# same file (Picard does this on retag) is dropped instead of queued
+# twice.
+_QUEUED = set()
+_QUEUED_LOCK = threading.Lock()
+
+
+def _mark_queued(audio_path):
+    """Record a path as queued; False if it already was."""
+    with _QUEUED_LOCK:
+        if audio_path in _QUEUED:
+            return False
+        _QUEUED.add(audio_path)
+        return True
+
+
+def _unmark_queued(audio_path):
+    with _QUEUED_LOCK:
+        _QUEUED.discard(audio_path)
+
+
+# Don't let pending lookups hold up Picard shutdown.
+atexit.register(_EXECUTOR.shutdown, wait=False)
+
+
+# ============================================================
+# Helpers: parsing metadata
+# ============================================================
+
+# Picard's "~length" is "m:ss" or "h:mm:ss"; one precompiled match per
+# file instead of split + list allocation + per-part int parsing.
+_LEN_RE = re.compile(r"^(?:(\d+):)?(\d+):(\d+)$")
+
+
+def _parse_length(length_str):
+    """Parse a "~length" value into whole seconds, or None."""
+    if not length_str:
+        return None
+    m = _LEN_RE.match(length_str)
+    if m is None:
+        log.warning(
+            "LRCLIB SIMPLE: failed to parse '~length' %r", length_str
+        )
+        return None
+    hours, minutes, seconds = m.groups()
+    return int(hours or 0) * 3600 + int(minutes) * 60 + int(seconds)
 
 
 # ============================================================
-# Helpers: building the query from metadata
+# HTTP client to LRCLIB (http.client, keep-alive pool, SSL verify disabled)
 # ============================================================
 
-def _build_query_from_snapshot(snapshot):
+# Single shared SSLContext (verification disabled, see module notes).
+# Building one per connection re-creates the OpenSSL context and cipher
+# lists every time and defeats TLS session resumption; one cached
+# context makes reconnects cheap too.
+_SSL_CTX = ssl._create_unverified_context()
+
+# Idle keep-alive connections to lrclib.net, reused across workers so an
+# album save pays the TLS handshake once instead of once per track.
+_IDLE_CONNECTIONS = []
+_POOL_LOCK = threading.Lock()
+
+
+def _new_connection():
+    return http.client.HTTPSConnection(
+        LRCLIB_HOST,
+        timeout=HTTP_TIMEOUT,
+        context=_SSL_CTX,
+    )
+
+
+def _acquire_connection():
+    """
+    Return (connection, reused): a pooled keep-alive connection when
+    one is idle (reused=True), else a freshly opened one.
     """
-    Build LRCLIB query parameters from a metadata snapshot.
+    with _POOL_LOCK:
+        if _IDLE_CONNECTIONS:
+            return _IDLE_CONNECTIONS.pop(), True
+
+    return _new_connection(), False
 
-    snapshot is a plain dict with at least:
-        title, artist, album, ~length
+
+def _release_connection(conn):
+    """Return a still-alive connection to the pool, or close it."""
+    with _POOL_LOCK:
+        if len(_IDLE_CONNECTIONS) < MAX_WORKERS:
+            _IDLE_CONNECTIONS.append(conn)
+            return
+    conn.close()
+
+
+def _gunzip_capped(data):
     """
-    title = snapshot.get("title")
-    artist = snapshot.get("artist")
-    album = snapshot.get("album")
-    duration = None
+    Decompress a gzip response body, enforcing MAX_RESPONSE_BYTES on
+    the *decompressed* output.
 
-    # parse "~length" safely
-    length_str = snapshot.get("~length")
-    if length_str:
-        try:
-            parts = length_str.split(":")
-            if len(parts) == 2:
-                minutes = int(parts[0])
-                seconds = int(parts[1])
-                duration = minutes * 60 + seconds
-        except Exception as exc:
-            log.warning(
-                "LRCLIB SIMPLE: failed to parse '~length' %r: %r",
-                length_str,
-                exc,
+    gzip.decompress would happily expand a small compressed body into
+    gigabytes; decompressing incrementally with a bounded max_length
+    lets us abandon a decompression bomb as soon as it crosses the cap.
+    """
+    decomp = zlib.decompressobj(16 + zlib.MAX_WBITS)
+    out = bytearray()
+    tail = data
+    while tail:
+        out += decomp.decompress(tail, READ_CHUNK_BYTES)
+        if len(out) > MAX_RESPONSE_BYTES:
+            raise ValueError(
+                "response larger than %d bytes after decompression"
+                % MAX_RESPONSE_BYTES
             )
+        tail = decomp.unconsumed_tail
+    out += decomp.flush()
+    if len(out) > MAX_RESPONSE_BYTES:
+        raise ValueError(
+            "response larger than %d bytes after decompression"
+            % MAX_RESPONSE_BYTES
+        )
+    return bytes(out)
+
+
+# How a server's silent close of an idle keep-alive connection shows up
+# when we try to reuse it.  Only these failures, and only on a pooled
+# connection, warrant a retry; timeouts, oversized responses, and any
+# failure on a fresh connection propagate immediately.
+_STALE_CONNECTION_ERRORS = (
+    http.client.RemoteDisconnected,
+    http.client.BadStatusLine,
+    ConnectionResetError,
+    BrokenPipeError,
+)
 
-    log.info(
-        "LRCLIB SIMPLE: Query → title=%r, artist=%r, album=%r, duration=%r",
-        title,
-        artist,
-        album,
-        duration,
-    )
 
-    # LRCLIB requires at least title, artist, duration
-    if not (title and artist and duration):
-        log.warning(
-            "LRCLIB SIMPLE: Missing required metadata "
-            "(title=%r, artist=%r, duration=%r). Skipping LRCLIB lookup.",
-            title,
-            artist,
-            duration,
-        )
-        return None
+def _request_on_connection(conn, path, headers):
+    """Run one GET on `conn` and return (status, headers, data)."""
+    conn.request("GET", path, headers=headers)
+    resp = conn.getresponse()
+    buf = bytearray()
+    while True:
+        chunk = resp.read(READ_CHUNK_BYTES)
+        if not chunk:
+            break
+        buf += chunk
+        if len(buf) > MAX_RESPONSE_BYTES:
+            raise ValueError(
+                "response larger than %d bytes" % MAX_RESPONSE_BYTES
+            )
+    data = bytes(buf)
 
-    return {
-        "track_name": title,
-        "artist_name": artist,
-        "album_name": album or "",
-        "duration": duration,
-    }
+    if resp.will_close:
+        conn.close()
+    else:
+        _release_connection(conn)
 
+    if (resp.getheader("Content-Encoding") or "").lower() == "gzip":
+        data = _gunzip_capped(data)
+    return resp.status, resp.headers, data
 
-# ============================================================
-# HTTP client to LRCLIB (urllib, SSL verify disabled)
-# ============================================================
 
-def _fetch_lyrics_from_lrclib(query):
+def _http_get(path, headers):
+    """
+    Issue a GET against LRCLIB on a pooled connection.
+
+    Returns (status, headers, data).  A request on a stale keep-alive
+    connection (server closed it while idle) is retried once on a fresh
+    connection; any other failure propagates to the caller.
+
+    Responses are requested gzip-compressed -- lyric JSON compresses
+    roughly 4x, which cuts the bytes on the wire accordingly -- and
+    transparently decompressed here.
+    """
+    headers = dict(headers)
+    headers.setdefault("Accept-Encoding", "gzip")
+
+    conn, reused = _acquire_connection()
+    try:
+        return _request_on_connection(conn, path, headers)
+    except _STALE_CONNECTION_ERRORS:
+        conn.close()
+        if not reused:
+            raise
+    except Exception:
+        conn.close()
+        raise
+
+    # The pooled connection went stale while idle; retry exactly once on
+    # a guaranteed-fresh connection, whose failures propagate.
+    conn = _new_connection()
+    try:
+        return _request_on_connection(conn, path, headers)
+    except Exception:
+        conn.close()
+        raise
+
+
+# Returned in place of lyrics when LRCLIB answers 304 Not Modified to a
+# conditional GET; the caller then reuses its cached copy.
+_NOT_MODIFIED = object()
+
+
+def _fetch_lyrics_from_lrclib(query, etag=None):
     """
-    Perform a synchronous HTTP GET to LRCLIB and return (lyrics, is_synced).
+    Perform a synchronous HTTP GET to LRCLIB.
+
+    When `etag` is given it is sent as If-None-Match, so an unchanged
+    entry costs a 304 with no body instead of a full payload + decode.
+
+    Returns (lyrics, is_synced, etag):
+        (lyrics_text, True, etag)   if syncedLyrics is available
+        (lyrics_text, False, etag)  if only plainLyrics is available
+        (_NOT_MODIFIED, None, etag) on 304 (reuse the cached copy)
+        (None, None, None)          if LRCLIB definitively has no lyrics
 
-    Returns:
-        (lyrics_text, True)   if syncedLyrics is available
-        (lyrics_text, False)  if only plainLyrics is available
-        (None, None)          on failure or no lyrics
+    Transport failures (timeout, DNS, connection errors) raise instead
+    of returning, so callers and caches never mistake an outage for a
+    "no lyrics" answer.
     """
-    url = LRCLIB_URL + urlencode(query)
-    log.info("LRCLIB SIMPLE: Requesting %s", url)
+    path = LRCLIB_GET_PATH + urlencode(query)
+    if _VERBOSE:
+        log.info("LRCLIB SIMPLE: Requesting %s", path)
 
-    ctx = ssl._create_unverified_context()  # disable SSL verification
+    headers = {"User-Agent": "Picard-LRCLIB-External-Save"}
+    if etag:
+        headers["If-None-Match"] = etag
 
     try:
-        req = Request(
-            url,
-            headers={"User-Agent": "Picard-LRCLIB-External-Save"},
-        )
-        with urlopen(req, context=ctx, timeout=15) as resp:
-            status = getattr(resp, "status", None)
+        status, resp_headers, data = _http_get(path, headers=headers)
+        if _VERBOSE:
             log.info("LRCLIB SIMPLE: HTTP status=%r", status)
-            data = resp.read()
     except Exception as exc:
         log.error("LRCLIB SIMPLE: HTTP request failed: %r", exc)
-        return None, None
+        raise
+
+    if status == 304:
+        return _NOT_MODIFIED, None, etag
+    if status == 404:
+        # LRCLIB's definitive "track unknown" -- a cacheable miss.
+        return None, None, None
+    if status != 200:
+        # 5xx and friends are outages, not answers; don't let them be
+        # cached as "no lyrics".
+        raise RuntimeError("LRCLIB HTTP status %r" % status)
+    new_etag = resp_headers.get("ETag")
 
     try:
-        text = data.decode("utf-8", errors="replace")
-        obj = json.loads(text)
+        # json.loads accepts bytes and does the UTF-8 decode internally,
+        # so don't decode to str first and pay for two passes.
+        obj = json.loads(data)
     except Exception as exc:
         log.error("LRCLIB SIMPLE: JSON decode failed: %r", exc)
-        return None, None
+        raise
 
     if isinstance(obj, list):
         if not obj:
-            return None, None
+            return None, None, None
         obj = obj[0]
 
     if not isinstance(obj, dict) or not obj.get("id"):
-        return None, None
+        return None, None, None
 
     synced = obj.get("syncedLyrics")
     plain = obj.get("plainLyrics")
 
     if synced:
-        log.info("LRCLIB SIMPLE: Synced lyrics found (%d chars)", len(synced))
-        return synced, True
+        if _VERBOSE:
+            log.info("LRCLIB SIMPLE: Synced lyrics found (%d chars)",
+                     len(synced))
+        return synced, True, new_etag
 
     if plain:
-        log.info("LRCLIB SIMPLE: Plain lyrics found (%d chars)", len(plain))
-        return plain, False
+        if _VERBOSE:
+            log.info("LRCLIB SIMPLE: Plain lyrics found (%d chars)",
+                     len(plain))
+        return plain, False, new_etag
+
+    return None, None, None
+
+
+def _search_album_on_lrclib(artist, album):
+    """
+    Fetch LRCLIB results for a whole artist+album with one request.
+
+    Returns a list of result dicts, or None on failure (callers then
+    fall back to per-track /api/get lookups).
+    """
+    path = LRCLIB_SEARCH_PATH + urlencode({
+        "artist_name": artist,
+        "album_name": album,
+    })
+    if _VERBOSE:
+        log.info("LRCLIB SIMPLE: Album search %s", path)
+
+    try:
+        status, _, data = _http_get(
+            path,
+            headers={"User-Agent": "Picard-LRCLIB-External-Save"},
+        )
+    except Exception as exc:
+        log.error("LRCLIB SIMPLE: Album search failed: %r", exc)
+        return None
+
+    if status != 200:
+        if _VERBOSE:
+            log.info("LRCLIB SIMPLE: Album search HTTP status=%r", status)
+        return None
+
+    try:
+        obj = json.loads(data)
+    except Exception as exc:
+        log.error("LRCLIB SIMPLE: Album search JSON decode failed: %r", exc)
+        return None
+
+    if not isinstance(obj, list):
+        return None
+    return obj
+
+
+# ============================================================
+# On-disk lyrics cache (survives Picard restarts)
+# ============================================================
+
+# Cached lookups older than this are treated as stale.  Stale rows with
+# an ETag are kept for cheap If-None-Match revalidation; stale rows
+# without one are evicted at startup.
+CACHE_TTL_DAYS = 30
+
+# "No lyrics" answers expire sooner: LRCLIB gains lyrics over time, so a
+# cached miss is only trusted this long before the track is asked again.
+NEGATIVE_TTL_DAYS = 7
+
+_CACHE_LOCK = threading.Lock()
+
+
+def _open_lyrics_cache():
+    """
+    Open (creating if needed) the on-disk lyrics cache.
+
+    Returns a sqlite3 connection, or None if the cache directory is
+    not usable -- the plugin then just works without persistence.
+    """
+    path = os.path.join(
+        os.path.expanduser("~"),
+        ".cache",
+        "lrclib_lyrics_external_save",
+        "lyrics.db",
+    )
+    try:
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        db = sqlite3.connect(path, check_same_thread=False)
+        db.execute(
+            "CREATE TABLE IF NOT EXISTS lyrics ("
+            "key TEXT PRIMARY KEY, lyrics TEXT, synced INTEGER, ts INTEGER)"
+        )
+        try:
+            db.execute("ALTER TABLE lyrics ADD COLUMN etag TEXT")
+        except sqlite3.OperationalError:
+            pass  # column already present
+        cutoff = int(time.time()) - CACHE_TTL_DAYS * 86400
+        db.execute(
+            "DELETE FROM lyrics WHERE ts < ? AND etag IS NULL", (cutoff,)
+        )
+        db.commit()
+        return db
+    except Exception as exc:
+        log.warning("LRCLIB SIMPLE: disk cache unavailable: %r", exc)
+        return None
+
+
+_CACHE_DB = _open_lyrics_cache()
+
+
+_WS_RE = re.compile(r"\s+")
+
+
+def _normalize_text(s):
+    """Casefold, strip diacritics, and collapse whitespace for cache keys."""
+    nfkd = unicodedata.normalize("NFKD", s)
+    stripped = "".join(c for c in nfkd if not unicodedata.combining(c))
+    return _WS_RE.sub(" ", stripped).casefold().strip()
+
+
+def _cache_key(track_name, artist_name, album_name, duration):
+    """
+    Hash the normalized query fields into a cache key.
+
+    Normalizing (casefold, no diacritics, collapsed whitespace, duration
+    snapped to 2 s) folds near-duplicate saves -- "Song"/"song",
+    "Beyoncé"/"Beyonce", a one-second rounding difference -- onto one
+    cache entry.  The original values are still what gets sent to
+    LRCLIB; only the key is normalized.
+    """
+    raw = "\n".join((
+        _normalize_text(track_name or ""),
+        _normalize_text(artist_name or ""),
+        _normalize_text(album_name or ""),
+        str(int(round(duration / 2.0)) * 2 if duration else 0),
+    ))
+    return hashlib.sha1(raw.encode("utf-8")).hexdigest()
+
+
+def _cache_get_row(key):
+    """Return a cached (lyrics, synced, etag, ts) row, or None on a miss."""
+    if _CACHE_DB is None:
+        return None
+    try:
+        with _CACHE_LOCK:
+            return _CACHE_DB.execute(
+                "SELECT lyrics, synced, etag, ts FROM lyrics WHERE key = ?",
+                (key,),
+            ).fetchone()
+    except Exception as exc:
+        log.warning("LRCLIB SIMPLE: disk cache read failed: %r", exc)
+        return None
+
+
+def _row_to_result(row):
+    """Map a cache row to the (lyrics, is_synced) pair workers expect."""
+    lyrics, synced = row[0], row[1]
+    if lyrics is None:
+        return None, None  # cached negative result
+    return lyrics, bool(synced)
+
+
+def _cache_put(key, lyrics, is_synced, etag=None):
+    if _CACHE_DB is None:
+        return
+    synced = None if is_synced is None else int(is_synced)
+    try:
+        with _CACHE_LOCK:
+            _CACHE_DB.execute(
+                "INSERT OR REPLACE INTO lyrics (key, lyrics, synced, ts, etag)"
+                " VALUES (?, ?, ?, ?, ?)",
+                (key, lyrics, synced, int(time.time()), etag),
+            )
+            _CACHE_DB.commit()
+    except Exception as exc:
+        log.warning("LRCLIB SIMPLE: disk cache write failed: %r", exc)
+
+
+# Lookups currently being fetched, keyed like the disk cache.  A second
+# concurrent worker asking for the same track waits on the first one's
+# Future instead of issuing a duplicate HTTP request.
+_INFLIGHT = {}
+_INFLIGHT_LOCK = threading.Lock()
+
+# In-memory memo of definitive lookups, keyed by the same normalized
+# key as the disk cache so near-duplicate queries ("Song"/"song", a
+# one-second duration difference) fold onto one entry here too.
+# Insertion-ordered dict; the oldest entry is dropped once full.
+MEMO_MAXSIZE = 512
+_MEMO = {}
+_MEMO_LOCK = threading.Lock()
+
 
-    return None, None
+def _memo_store(key, result):
+    with _MEMO_LOCK:
+        if key not in _MEMO and len(_MEMO) >= MEMO_MAXSIZE:
+            _MEMO.pop(next(iter(_MEMO)))
+        _MEMO[key] = result
+
+
+def _fetch_cached(track_name, artist_name, album_name, duration):
+    """
+    Memoized LRCLIB lookup keyed on the normalized query fields.
+
+    Re-saving the same track (re-tag, move, rename) returns the cached
+    (lyrics, is_synced) pair without another network round trip.
+    Negative results are cached too, so a track LRCLIB does not know
+    is not re-requested on every save.  The original field values are
+    still what goes on the wire; only the cache keys are normalized.
+
+    The on-disk cache is consulted after the in-memory memo, so lookups
+    done in an earlier Picard session are answered without touching the
+    network at all.  A stale row that carries an ETag is revalidated
+    with If-None-Match, so an unchanged entry costs a 304 instead of a
+    full body transfer.
+    """
+    key = _cache_key(track_name, artist_name, album_name, duration)
+    with _MEMO_LOCK:
+        if key in _MEMO:
+            return _MEMO[key]
+
+    row = _cache_get_row(key)
+    if row is not None:
+        ttl_days = NEGATIVE_TTL_DAYS if row[0] is None else CACHE_TTL_DAYS
+        if time.time() - row[3] < ttl_days * 86400:
+            if _VERBOSE:
+                log.info("LRCLIB SIMPLE: disk cache hit for %r / %r",
+                         artist_name, track_name)
+            result = _row_to_result(row)
+            _memo_store(key, result)
+            return result
+
+    with _INFLIGHT_LOCK:
+        future = _INFLIGHT.get(key)
+        if future is not None:
+            pending = future
+        else:
+            pending = None
+            future = concurrent.futures.Future()
+            _INFLIGHT[key] = future
+
+    if pending is not None:
+        if _VERBOSE:
+            log.info("LRCLIB SIMPLE: waiting on in-flight lookup for %r / %r",
+                     artist_name, track_name)
+        return pending.result()
+
+    try:
+        # A tuple of pairs feeds urlencode directly with no dict built
+        # and torn down per request.
+        lyrics, is_synced, etag = _fetch_lyrics_from_lrclib(
+            (
+                ("track_name", track_name),
+                ("artist_name", artist_name),
+                ("album_name", album_name),
+                ("duration", duration),
+            ),
+            etag=row[2] if row is not None else None,
+        )
+        if lyrics is _NOT_MODIFIED:
+            lyrics, is_synced = _row_to_result(row)
+        # Only reached on a definitive answer -- failures raise above,
+        # so an outage is never persisted as a negative row.
+        _cache_put(key, lyrics, is_synced, etag)
+        _memo_store(key, (lyrics, is_synced))
+        future.set_result((lyrics, is_synced))
+    except Exception as exc:
+        if row is not None and row[0] is not None:
+            # Revalidation of a stale positive row failed at the network
+            # level: serve the stale lyrics and leave the row (and its
+            # ETag) untouched rather than downgrading it to an error.
+            log.warning(
+                "LRCLIB SIMPLE: revalidation failed for %r / %r, "
+                "serving stale cached lyrics: %r",
+                artist_name,
+                track_name,
+                exc,
+            )
+            lyrics, is_synced = _row_to_result(row)
+            future.set_result((lyrics, is_synced))
+        else:
+            future.set_exception(exc)
+            raise
+    finally:
+        with _INFLIGHT_LOCK:
+            _INFLIGHT.pop(key, None)
+
+    return lyrics, is_synced
+
+
+def clear_lyrics_cache():
+    """
+    Drop all cached LRCLIB lookups, in memory and on disk
+    (e.g. after lyrics were uploaded).
+    """
+    with _MEMO_LOCK:
+        _MEMO.clear()
+    if _CACHE_DB is not None:
+        try:
+            with _CACHE_LOCK:
+                _CACHE_DB.execute("DELETE FROM lyrics")
+                _CACHE_DB.commit()
+        except Exception as exc:
+            log.warning("LRCLIB SIMPLE: disk cache clear failed: %r", exc)
 
 
 # ============================================================
 # Sidecar writer
 # ============================================================
 
+def _sidecar_exists(audio_path):
+    """Return True if a non-empty .lrc or .txt sidecar already exists."""
+    directory, fname = os.path.split(audio_path)
+    stem, _ = os.path.splitext(fname)
+    for ext in (".lrc", ".txt"):
+        p = os.path.join(directory, stem + ext)
+        try:
+            if os.path.exists(p) and os.path.getsize(p) > 0:
+                return True
+        except OSError:
+            pass
+    return False
+
+
 def _write_sidecar_for_path(audio_path, lyrics, is_synced):
     directory, fname = os.path.split(audio_path)
     stem, _ = os.path.splitext(fname)
     ext = ".lrc" if is_synced else ".txt"
     out_path = os.path.join(directory, stem + ext)
 
-    log.info("LRCLIB SIMPLE: Writing sidecar %s", out_path)
+    if _VERBOSE:
+        log.info("LRCLIB SIMPLE: Writing sidecar %s", out_path)
 
+    # Pre-encode and write the whole payload with one os.write, then
+    # rename into place: fewer syscalls than the buffered text layer,
+    # and a crash never leaves a half-written sidecar behind.
+    tmp_path = out_path + ".tmp"
     try:
-        with open(out_path, "w", encoding="utf-8") as f:
-            f.write(lyrics)
-        log.info("LRCLIB SIMPLE: Successfully wrote sidecar")
+        payload = lyrics.encode("utf-8")
+        fd = os.open(tmp_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+        try:
+            os.write(fd, payload)
+        finally:
+            os.close(fd)
+        os.replace(tmp_path, out_path)
+        if _VERBOSE:
+            log.info("LRCLIB SIMPLE: Successfully wrote sidecar")
     except Exception as exc:
         log.error("LRCLIB SIMPLE: Failed to write sidecar: %r", exc)
+        try:
+            os.unlink(tmp_path)
+        except OSError:
+            pass
 
 
 # ============================================================
 # Worker thread logic
 # ============================================================
 
-def _worker_for_file(audio_path, snapshot):
+def _worker_for_file(audio_path, title, artist, album, duration):
     """
-    Background worker: build query from metadata snapshot, fetch lyrics,
-    and write the sidecar file.
+    Background worker: fetch lyrics for one file and write the sidecar.
+
+    The metadata fields arrive as positional values -- the hook already
+    validated them -- so the per-file path allocates no snapshot or
+    query dicts along the way.
     """
     try:
-        log.info("LRCLIB SIMPLE: Worker started for %s", audio_path)
-
-        query = _build_query_from_snapshot(snapshot)
-        if not query:
+        if _VERBOSE:
+            log.info("LRCLIB SIMPLE: Worker started for %s", audio_path)
+
+        if not OVERWRITE_EXISTING and _sidecar_exists(audio_path):
+            if _VERBOSE:
+                log.info(
+                    "LRCLIB SIMPLE: Sidecar already present for %s, skipping",
+                    audio_path,
+                )
             return
 
-        lyrics, is_synced = _fetch_lyrics_from_lrclib(query)
+        lyrics, is_synced = _fetch_cached(title, artist, album or "", duration)
         if not lyrics:
-            log.info("LRCLIB SIMPLE: No lyrics found for %s", audio_path)
+            if _VERBOSE:
+                log.info("LRCLIB SIMPLE: No lyrics found for %s", audio_path)
             return
 
         _write_sidecar_for_path(audio_path, lyrics, is_synced)
@@ -214,6 +782,143 @@ def _worker_for_file(audio_path, snapshot):
             audio_path,
             exc,
         )
+    finally:
+        _unmark_queued(audio_path)
+
+
+# ============================================================
+# Album-level batching: one /api/search instead of N /api/get
+# ============================================================
+
+# Pending files keyed by (artist, album).  Each bucket holds the files
+# saved so far plus the Timer that will flush it once saves go quiet
+# for ALBUM_BATCH_WINDOW seconds.
+_BATCHES = {}
+_BATCH_LOCK = threading.Lock()
+
+
+def _enqueue_for_album_batch(audio_path, title, artist, album, duration):
+    """
+    Queue a saved file into its album bucket and (re)arm the flush timer.
+
+    Files without an album cannot be batched and go straight to the
+    per-track worker.
+    """
+    if not album:
+        _EXECUTOR.submit(
+            _worker_for_file, audio_path, title, artist, album, duration
+        )
+        return
+
+    key = (artist, album)
+    with _BATCH_LOCK:
+        bucket = _BATCHES.get(key)
+        if bucket is None:
+            bucket = {"entries": [], "timer": None}
+            _BATCHES[key] = bucket
+        bucket["entries"].append((audio_path, title, duration))
+        if bucket["timer"] is not None:
+            bucket["timer"].cancel()
+        timer = threading.Timer(ALBUM_BATCH_WINDOW, _flush_album_batch, (key,))
+        timer.daemon = True
+        bucket["timer"] = timer
+        timer.start()
+
+
+def _flush_album_batch(key):
+    """Timer callback: hand a quiesced album bucket to the worker pool."""
+    with _BATCH_LOCK:
+        bucket = _BATCHES.pop(key, None)
+    if bucket is None:
+        return
+    try:
+        _EXECUTOR.submit(_process_album_batch, key, bucket["entries"])
+    except Exception as exc:
+        log.error("LRCLIB SIMPLE: Failed to submit album batch: %r", exc)
+        # Mirror the hook's own submit-failure handling: without this,
+        # the paths stay marked forever and later re-saves are dropped
+        # as duplicates.
+        for entry in bucket["entries"]:
+            _unmark_queued(entry[0])
+
+
+def _process_album_batch(key, entries):
+    """
+    Resolve all files of one album, preferring a single search request.
+
+    Single-file buckets and files the search results cannot answer fall
+    back to the per-track worker.
+    """
+    artist, album = key
+    try:
+        index = None
+        if len(entries) > 1:
+            results = _search_album_on_lrclib(artist, album)
+            if results:
+                index = {}
+                for item in results:
+                    name = (item.get("trackName") or "").casefold()
+                    if name:
+                        index.setdefault(name, []).append(item)
+
+        for audio_path, title, duration in entries:
+            if index is not None and _apply_batch_result(
+                audio_path, title, artist, album, duration, index
+            ):
+                continue
+            _worker_for_file(audio_path, title, artist, album, duration)
+    except Exception as exc:
+        log.error(
+            "LRCLIB SIMPLE: Album batch failed for %r / %r: %r",
+            artist,
+            album,
+            exc,
+        )
+    finally:
+        # _worker_for_file unmarks its own path; this covers entries the
+        # batch satisfied directly (or never reached after an error).
+        for entry in entries:
+            _unmark_queued(entry[0])
+
+
+def _apply_batch_result(audio_path, title, artist, album, duration, index):
+    """
+    Try to satisfy one file from the album search results.
+
+    Returns True when the file needs no further work (sidecar written
+    or already present); False to fall back to the per-track lookup.
+    """
+    if not OVERWRITE_EXISTING and _sidecar_exists(audio_path):
+        return True
+
+    match = None
+    for item in index.get(title.casefold(), ()):
+        try:
+            item_duration = int(round(float(item.get("duration"))))
+        except (TypeError, ValueError):
+            continue
+        if abs(item_duration - duration) <= DURATION_TOLERANCE:
+            match = item
+            break
+    if match is None:
+        return False
+
+    synced = match.get("syncedLyrics")
+    plain = match.get("plainLyrics")
+    if synced:
+        lyrics, is_synced = synced, True
+    elif plain:
+        lyrics, is_synced = plain, False
+    else:
+        return False  # let /api/get have the final word
+
+    _cache_put(
+        _cache_key(title, artist, album, duration),
+        lyrics,
+        is_synced,
+    )
+    _write_sidecar_for_path(audio_path, lyrics, is_synced)
+    return True
 
 
 # ============================================================
@@ -232,31 +937,67 @@ def lrclib_simple_file_post_save(file):
 
     try:
         md = file.metadata
-        snapshot = {
-            "title": md.get("title"),
-            "artist": md.get("artist"),
-            "album": md.get("album"),
-            "~length": md.get("~length"),
-        }
-        log.info(
-            "LRCLIB SIMPLE: Post-save → %s (title=%r, artist=%r)",
-            audio_path,
-            snapshot.get("title"),
-            snapshot.get("artist"),
-        )
+        title = md.get("title")
+        artist = md.get("artist")
+        album = md.get("album")
+        duration = _parse_length(md.get("~length"))
+        if _VERBOSE:
+            log.info(
+                "LRCLIB SIMPLE: Post-save → %s (title=%r, artist=%r)",
+                audio_path,
+                title,
+                artist,
+            )
     except Exception as exc:
         log.error("LRCLIB SIMPLE: Cannot snapshot metadata: %r", exc)
         return
 
+    # LRCLIB requires title, artist and duration; check here so files
+    # that could never be looked up are not scheduled at all.
+    if not (title and artist and duration):
+        if _VERBOSE:
+            log.info(
+                "LRCLIB SIMPLE: Missing required metadata for %s, "
+                "skipping LRCLIB lookup",
+                audio_path,
+            )
+        return
+
+    if not _mark_queued(audio_path):
+        if _VERBOSE:
+            log.info(
+                "LRCLIB SIMPLE: %s already queued or in flight, skipping",
+                audio_path,
+            )
+        return
+
     try:
-        t = threading.Thread(
-            target=_worker_for_file,
-            args=(audio_path, snapshot),
-            daemon=True,
-        )
-        t.start()
+        _enqueue_for_album_batch(audio_path, title, artist, album, duration)
     except Exception as exc:
-        log.error("LRCLIB SIMPLE: Failed to start worker thread: %r", exc)
+        log.error("LRCLIB SIMPLE: Failed to submit worker: %r", exc)
+        _unmark_queued(audio_path)
+
+
+def _register_once():
+    """
+    Register the post-save hook exactly once per Picard process.
+
+    If a stray copy of this module sits elsewhere on Picard's plugin
+    search path, both copies are imported and would each register the
+    hook -- doubling every lookup, request, and sidecar write.  A flag
+    on picard.file (shared by every copy, whatever its module name)
+    turns the second registration into a no-op.
+    """
+    pf = sys.modules.get("picard.file")
+    if pf is not None:
+        if getattr(pf, "_lrclib_external_save_registered", False):
+            log.warning(
+                "LRCLIB SIMPLE: post-save hook already registered, "
+                "skipping duplicate plugin copy"
+            )
+            return
+        pf._lrclib_external_save_registered = True
+    register_file_post_save_processor(lrclib_simple_file_post_save)
 
 
-register_file_post_save_processor(lrclib_simple_file_post_save)
+_register_once()